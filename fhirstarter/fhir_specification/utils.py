@@ -4,7 +4,7 @@ import importlib.metadata
 import os
 import zipfile
 from copy import deepcopy
-from typing import Dict, Set
+from typing import Dict, FrozenSet
 
 import orjson
 
@@ -68,10 +68,14 @@ def is_resource_type(resource_type: str) -> bool:
 
 
 @cache
-def _load_resources_list() -> Set[str]:
-    """Load the list of resources from the JSON file."""
+def _load_resources_list() -> FrozenSet[str]:
+    """
+    Load the list of resources from the JSON file.
+
+    The list is returned as a frozenset, because it is used for membership checks on every request.
+    """
     with open(FHIR_DIR / "resource_types.json") as file_:
-        return orjson.loads(file_.read())
+        return frozenset(orjson.loads(file_.read()))
 
 
 @cache
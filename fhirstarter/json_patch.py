@@ -13,7 +13,7 @@ from typing import (
 from pydantic import BaseModel, Extra, Field, ValidationError, root_validator, validator
 from pydantic.error_wrappers import ErrorWrapper
 
-_PATH_PATTERN = re.compile("^\/(?:[^/]+\/)*[^/]+$")
+_PATH_PATTERN = re.compile(r"/(?:[^/]+/)*[^/]+")
 
 
 class JSONPatchOperation(BaseModel):
@@ -42,7 +42,7 @@ class JSONPatchOperation(BaseModel):
     @validator("from_", "path")
     def validate_json_pointers(cls, json_pointer: str) -> str:
         """Ensure that the from and path fields contain valid JSON Pointers."""
-        if not re.fullmatch(_PATH_PATTERN, json_pointer):
+        if not _PATH_PATTERN.fullmatch(json_pointer):
             raise ValueError(f"invalid JSON Pointer")
         return json_pointer
 
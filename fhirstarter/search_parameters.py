@@ -23,6 +23,8 @@ from .fhir_specification.utils import (
 )
 from .interactions import InteractionContext
 
+_UNDERSCORE_LOWERCASE_PATTERN = re.compile("_[a-z]")
+
 
 class SearchParameters:
     def __init__(
@@ -64,7 +66,10 @@ def var_name_to_qp_name(name: str) -> str:
     plus the lowercase version of the character.
     """
     if name.startswith("_"):
-        return f"_{re.sub('_[a-z]', lambda m: m.group(0)[1:].upper(), name[1:])}"
+        camel_case_name = _UNDERSCORE_LOWERCASE_PATTERN.sub(
+            lambda m: m.group(0)[1:].upper(), name[1:]
+        )
+        return f"_{camel_case_name}"
 
     if name.endswith("_"):
         name = name[:-1]
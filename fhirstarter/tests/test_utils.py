@@ -5,6 +5,14 @@ import pytest
 from ..utils import ParsedRequest, parse_fhir_request
 from .utils import generate_fhir_resource_id, make_request
 
+_READ_ID = generate_fhir_resource_id()
+_UPDATE_ID = generate_fhir_resource_id()
+_PATCH_ID = generate_fhir_resource_id()
+_DELETE_ID = generate_fhir_resource_id()
+_OPERATION_GET_ID = generate_fhir_resource_id()
+_OPERATION_POST_ID = generate_fhir_resource_id()
+_UNMATCHED_ID = generate_fhir_resource_id()
+
 
 @pytest.mark.parametrize(
     argnames="mount_path",
@@ -29,69 +37,69 @@ from .utils import generate_fhir_resource_id, make_request
             (
                 "read",
                 "GET",
-                f"/Patient/{(id_ := generate_fhir_resource_id())}",
+                f"/Patient/{_READ_ID}",
                 ParsedRequest(  # type: ignore[call-arg]
                     request_type="interaction",
                     resource_type="Patient",
-                    resource_id=id_,
+                    resource_id=_READ_ID,
                     interaction_type="read",
                 ),
             ),
             (
                 "read unrecognized resource type",
                 "GET",
-                f"/FakeResource/{(id_ := generate_fhir_resource_id())}",
+                f"/FakeResource/{_UNMATCHED_ID}",
                 ParsedRequest(),
             ),
             (
                 "update",
                 "PUT",
-                f"/Patient/{(id_ := generate_fhir_resource_id())}",
+                f"/Patient/{_UPDATE_ID}",
                 ParsedRequest(  # type: ignore[call-arg]
                     request_type="interaction",
                     resource_type="Patient",
-                    resource_id=id_,
+                    resource_id=_UPDATE_ID,
                     interaction_type="update",
                 ),
             ),
             (
                 "update unrecognized resource type",
                 "PUT",
-                f"/FakeResource/{(id_ := generate_fhir_resource_id())}",
+                f"/FakeResource/{_UNMATCHED_ID}",
                 ParsedRequest(),
             ),
             (
                 "patch",
                 "PATCH",
-                f"/Patient/{(id_ := generate_fhir_resource_id())}",
+                f"/Patient/{_PATCH_ID}",
                 ParsedRequest(  # type: ignore[call-arg]
                     request_type="interaction",
                     resource_type="Patient",
-                    resource_id=id_,
+                    resource_id=_PATCH_ID,
                     interaction_type="patch",
                 ),
             ),
             (
                 "patch unrecognized resource type",
                 "PATCH",
-                f"/FakeResource/{(id_ := generate_fhir_resource_id())}",
+                f"/FakeResource/{_UNMATCHED_ID}",
                 ParsedRequest(),
             ),
             (
                 "delete",
                 "DELETE",
-                f"/Patient/{(id_ := generate_fhir_resource_id())}",
+                f"/Patient/{_DELETE_ID}",
                 ParsedRequest(  # type: ignore[call-arg]
                     request_type="interaction",
                     resource_type="Patient",
-                    resource_id=id_,
+                    resource_id=_DELETE_ID,
                     interaction_type="delete",
                 ),
             ),
             (
                 "delete unrecognized resource type",
                 "DELETE",
-                f"/FakeResource/{(id_ := generate_fhir_resource_id())}",
+                f"/FakeResource/{_UNMATCHED_ID}",
                 ParsedRequest(),
             ),
             (
@@ -145,25 +153,31 @@ from .utils import generate_fhir_resource_id, make_request
                 "/FakeResource/_search",
                 ParsedRequest(),
             ),
+            (
+                "search POST without resource type",
+                "POST",
+                "/_search",
+                ParsedRequest(),
+            ),
             (
                 "operation GET",
                 "GET",
-                f"/Patient/{(id_ := generate_fhir_resource_id())}/$export",
+                f"/Patient/{_OPERATION_GET_ID}/$export",
                 ParsedRequest(  # type: ignore[call-arg]
                     request_type="operation",
                     resource_type="Patient",
-                    resource_id=id_,
+                    resource_id=_OPERATION_GET_ID,
                     operation_name="export",
                 ),
             ),
             (
                 "operation POST",
                 "POST",
-                f"/Patient/{(id_ := generate_fhir_resource_id())}/$export",
+                f"/Patient/{_OPERATION_POST_ID}/$export",
                 ParsedRequest(  # type: ignore[call-arg]
                     request_type="operation",
                     resource_type="Patient",
-                    resource_id=id_,
+                    resource_id=_OPERATION_POST_ID,
                     operation_name="export",
                 ),
             ),
@@ -214,19 +228,19 @@ from .utils import generate_fhir_resource_id, make_request
             (
                 "operation PUT (invalid request)",
                 "PUT",
-                f"/Patient/{(id_ := generate_fhir_resource_id())}/$export",
+                f"/Patient/{_UNMATCHED_ID}/$export",
                 ParsedRequest(),
             ),
             (
                 "unrecognized GET path",
                 "GET",
-                f"/Patient/{(id_ := generate_fhir_resource_id())}/extra",
+                f"/Patient/{_UNMATCHED_ID}/extra",
                 ParsedRequest(),
             ),
             (
                 "unrecognized PUT path",
                 "PUT",
-                f"/FakeResource/{(id_ := generate_fhir_resource_id())}/extra",
+                f"/FakeResource/{_UNMATCHED_ID}/extra",
                 ParsedRequest(),
             ),
             (
@@ -238,19 +252,19 @@ from .utils import generate_fhir_resource_id, make_request
             (
                 "unrecognized PATCH path",
                 "PATCH",
-                f"/FakeResource/{(id_ := generate_fhir_resource_id())}/extra",
+                f"/FakeResource/{_UNMATCHED_ID}/extra",
                 ParsedRequest(),
             ),
             (
                 "unrecognized DELETE path",
                 "DELETE",
-                f"/FakeResource/{(id_ := generate_fhir_resource_id())}/extra",
+                f"/FakeResource/{_UNMATCHED_ID}/extra",
                 ParsedRequest(),
             ),
             (
                 "unsupported HTTP method",
                 "HEAD",
-                f"/Patient/{(id_ := generate_fhir_resource_id())}/extra",
+                f"/Patient/{_UNMATCHED_ID}/extra",
                 ParsedRequest(),
             ),
         ]
@@ -268,3 +282,15 @@ def test_parse_fhir_request(
         parse_fhir_request(make_request(request_method, f"{mount_path}{path}"))
         == expected_result
     )
+
+
+def test_parse_fhir_request_cached_on_scope() -> None:
+    request = make_request("POST", "/Patient/_search")
+    parsed_request = parse_fhir_request(request)
+
+    assert parse_fhir_request(request) is parsed_request
+
+    # Rewriting the method or path must invalidate the cached result
+    request.scope["method"] = "DELETE"
+    request.scope["path"] = f"/Patient/{generate_fhir_resource_id()}"
+    assert parse_fhir_request(request).interaction_type == "delete"
@@ -1,6 +1,7 @@
 """Miscellaneous utility functions."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable, ClassVar, Dict, Literal, Sequence, Union
 
 from fastapi import Request
@@ -12,7 +13,7 @@ from .interactions import ResourceType, SearchTypeInteraction, TypeInteraction
 from .resources import Bundle, OperationOutcome, Resource
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedRequest:
     request_type: Union[Literal["interaction", "operation"], None] = None
     resource_type: Union[str, None] = None
@@ -26,6 +27,18 @@ class ParsedRequest:
     operation_name: Union[str, None] = None
 
 
+# Returned whenever a request is not recognized as a FHIR request; ParsedRequest is frozen, so a
+# single instance can be shared
+_EMPTY_PARSED_REQUEST = ParsedRequest()
+
+# The capabilities interaction has no variable parts, so it can be shared in the same way
+_CAPABILITIES_PARSED_REQUEST = ParsedRequest(  # type: ignore[call-arg]
+    request_type="interaction", interaction_type="capabilities"
+)
+
+_PARSED_REQUEST_SCOPE_KEY = "fhirstarter.parsed_request"
+
+
 def parse_fhir_request(request: Request) -> ParsedRequest:
     """
     Parse a FHIR request into its component parts, and determine an interaction type or operation
@@ -39,23 +52,52 @@ def parse_fhir_request(request: Request) -> ParsedRequest:
     capabilities interactions, and will identify operations. Further enhancement is needed to
     support more use cases.
     """
-    split_path = request.url.path.split("/")
+    # Read the path straight from the ASGI scope; request.url builds and parses a full URL
+    scope = request.scope
+    method = request.method
+    path = scope["path"]
+
+    # A request is parsed several times over its lifetime (by middleware and by exception
+    # handlers), so the result is cached on the scope. The method and path are stored with it
+    # because middleware may rewrite them (e.g. a search POST becomes a search GET).
+    cached = scope.get(_PARSED_REQUEST_SCOPE_KEY)
+    if cached and cached[0] == method and cached[1] == path:
+        return cached[2]
+
+    parsed_request = _parse_fhir_request_path(method, path)
+    scope[_PARSED_REQUEST_SCOPE_KEY] = (method, path, parsed_request)
+
+    return parsed_request
+
+
+@lru_cache(maxsize=2048)
+def _parse_fhir_request_path(method: str, path: str) -> ParsedRequest:
+    """
+    Parse a FHIR request given its method and path.
+
+    Results are cached, because the same method and path pairs recur constantly (e.g. health checks
+    and capability statement polling). The cache is bounded, since paths that contain resource IDs
+    are effectively unlimited.
+    """
+    # Only the last three path segments matter here, so any mount prefix or other leading segments
+    # are left unsplit
+    split_path = path.rsplit("/", 3)
     if not split_path:
-        return ParsedRequest()
+        return _EMPTY_PARSED_REQUEST
 
     if split_path[-1].startswith("$"):
-        return _parse_fhir_operation_request(request, split_path)
+        return _parse_fhir_operation_request(method, split_path)
     else:
-        return _parse_fhir_interaction_request(request, split_path)
+        return _parse_fhir_interaction_request(method, split_path)
 
 
 def _parse_fhir_operation_request(
-    request: Request, split_path: Sequence[str]
+    method: str, split_path: Sequence[str]
 ) -> ParsedRequest:
     """Parse a potential FHIR operation request."""
     # The request may be a FHIR operation -- make sure the method is either a GET or POST
-    if request.method not in ("GET", "POST"):
-        return ParsedRequest()
+    if method not in ("GET", "POST"):
+        return _EMPTY_PARSED_REQUEST
 
     resource_type = None
     resource_id = None
@@ -84,73 +126,96 @@ def _parse_fhir_operation_request(
 
 
 def _parse_fhir_interaction_request(
-    request: Request, split_path: Sequence[str]
+    method: str, split_path: Sequence[str]
 ) -> ParsedRequest:
     """Parse a potential FHIR interaction request."""
     # The request may be a FHIR interaction -- determine what it is based on the request method
     # and the URL format
-    resource_type = None
-    resource_id = None
-    interaction_type: Union[str, None]
-
-    path_parts_count = len(split_path)
-
-    if request.method == "GET":
-        if split_path[-1] == "metadata":
-            interaction_type = "capabilities"
-        elif is_resource_type(split_path[-1]):
-            resource_type = split_path[-1]
-            interaction_type = "search-type"
-        elif path_parts_count >= 3:
-            resource_type = split_path[-2]
-            resource_id = split_path[-1]
-            interaction_type = "read"
-        else:
-            return ParsedRequest()
-    elif request.method == "POST":
-        if is_resource_type(split_path[-1]):
-            resource_type = split_path[-1]
-            interaction_type = "create"
-        elif split_path[-1] == "_search":
-            resource_type = split_path[-2]
-            interaction_type = "search-type"
-        else:
-            return ParsedRequest()
-    elif request.method == "PUT":
-        if path_parts_count >= 3:
-            resource_type = split_path[-2]
-            resource_id = split_path[-1]
-            interaction_type = "update"
-        else:
-            return ParsedRequest()
-    elif request.method == "PATCH":
-        if path_parts_count >= 3:
-            resource_type = split_path[-2]
-            resource_id = split_path[-1]
-            interaction_type = "patch"
-        else:
-            return ParsedRequest()
-    elif request.method == "DELETE":
-        if path_parts_count >= 3:
-            resource_type = split_path[-2]
-            resource_id = split_path[-1]
-            interaction_type = "delete"
+    parse_function = _INTERACTION_PARSE_FUNCTIONS.get(method)
+    if not parse_function:
+        return _EMPTY_PARSED_REQUEST
+
+    return parse_function(split_path)
+
+
+def _parse_get_interaction_request(split_path: Sequence[str]) -> ParsedRequest:
+    """Parse a potential capabilities, search-type, or read interaction request."""
+    if split_path[-1] == "metadata":
+        return _CAPABILITIES_PARSED_REQUEST
+    elif is_resource_type(split_path[-1]):
+        return ParsedRequest(  # type: ignore[call-arg]
+            request_type="interaction",
+            resource_type=split_path[-1],
+            interaction_type="search-type",
+        )
+    else:
+        return _parse_instance_interaction_request(split_path, "read")
+
+
+def _parse_post_interaction_request(split_path: Sequence[str]) -> ParsedRequest:
+    """Parse a potential create or search-type interaction request."""
+    # "_search" is never a resource type, so the cheap literal comparison can safely go first
+    if split_path[-1] == "_search":
+        if len(split_path) >= 2 and is_resource_type(split_path[-2]):
+            return ParsedRequest(  # type: ignore[call-arg]
+                request_type="interaction",
+                resource_type=split_path[-2],
+                interaction_type="search-type",
+            )
         else:
-            return ParsedRequest()
+            return _EMPTY_PARSED_REQUEST
+    elif is_resource_type(split_path[-1]):
+        return ParsedRequest(  # type: ignore[call-arg]
+            request_type="interaction",
+            resource_type=split_path[-1],
+            interaction_type="create",
+        )
     else:
-        return ParsedRequest()
+        return _EMPTY_PARSED_REQUEST
+
+
+def _parse_put_interaction_request(split_path: Sequence[str]) -> ParsedRequest:
+    """Parse a potential update interaction request."""
+    return _parse_instance_interaction_request(split_path, "update")
+
+
+def _parse_patch_interaction_request(split_path: Sequence[str]) -> ParsedRequest:
+    """Parse a potential patch interaction request."""
+    return _parse_instance_interaction_request(split_path, "patch")
+
 
+def _parse_delete_interaction_request(split_path: Sequence[str]) -> ParsedRequest:
+    """Parse a potential delete interaction request."""
+    return _parse_instance_interaction_request(split_path, "delete")
+
+
+def _parse_instance_interaction_request(
+    split_path: Sequence[str],
+    interaction_type: Literal["read", "update", "patch", "delete"],
+) -> ParsedRequest:
+    """Parse a potential interaction request on a resource instance (e.g. /Patient/123)."""
     # If the resource type found is not an actual resource type, then it's not a FHIR
     # interaction
-    if resource_type and not is_resource_type(resource_type):
-        return ParsedRequest()
-
-    return ParsedRequest(  # type: ignore[call-arg]
-        request_type="interaction",
-        resource_type=resource_type,
-        resource_id=resource_id,
-        interaction_type=interaction_type,
-    )
+    if len(split_path) >= 3 and is_resource_type(split_path[-2]):
+        return ParsedRequest(  # type: ignore[call-arg]
+            request_type="interaction",
+            resource_type=split_path[-2],
+            resource_id=split_path[-1],
+            interaction_type=interaction_type,
+        )
+    else:
+        return _EMPTY_PARSED_REQUEST
+
+
+# Interaction parse functions keyed by HTTP method, so that a request is only checked against the
+# URL formats that are valid for its method
+_INTERACTION_PARSE_FUNCTIONS: Dict[str, Callable[[Sequence[str]], ParsedRequest]] = {
+    "GET": _parse_get_interaction_request,
+    "POST": _parse_post_interaction_request,
+    "PUT": _parse_put_interaction_request,
+    "PATCH": _parse_patch_interaction_request,
+    "DELETE": _parse_delete_interaction_request,
+}
 
 
 def make_operation_outcome(